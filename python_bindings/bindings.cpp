@@ -5,7 +5,14 @@
 
 #ifdef _OPENMP
 #include <omp.h>
+// setup.py 在 OpenMP 探测通过时定义 DEEPSEARCH_HAVE_OPENMP；
+// 其他构建方式（如 CMake）只带 -fopenmp 时同样启用线程控制接口
+#ifndef DEEPSEARCH_HAVE_OPENMP
+#define DEEPSEARCH_HAVE_OPENMP 1
 #endif
+#endif
+
+#include <cstdlib>
 
 #include "hnsw/builder.h"
 #include "hnsw/hnsw.h"
@@ -41,12 +48,19 @@ NdArray<T> to_buffer(py::object obj) {
 // 2. Parallel-for utility: uses OpenMP if available, otherwise falls back to
 // serial
 // -----------------------------------------------------------------------------
+// 批量小于 DEEPSEARCH_OMP_CUTOFF 时走串行路径，省掉并行区的启动开销；
+// setup.py 通过同名环境变量覆盖默认值
+#ifndef DEEPSEARCH_OMP_CUTOFF
+#define DEEPSEARCH_OMP_CUTOFF 1
+#endif
+
 template <typename Func>
 void parallel_for(size_t n, int num_threads, Func f) {
 #ifdef _OPENMP
   int original = omp_get_max_threads();
   if (num_threads > 0) omp_set_num_threads(num_threads);
-#pragma omp parallel for schedule(dynamic)
+#pragma omp parallel for if (n > (size_t)DEEPSEARCH_OMP_CUTOFF) \
+    schedule(dynamic)
   for (size_t i = 0; i < n; ++i) {
     f(i);
   }
@@ -177,15 +191,29 @@ struct Searcher {
 PYBIND11_MODULE(deepsearch, m) {
   m.doc() = "DeepSearch Python bindings";
 
-#ifdef _OPENMP
+#ifdef DEEPSEARCH_HAVE_OPENMP
+  // 关闭动态线程数，保证并行度可预测；在 joblib/multiprocessing 进程池
+  // 中运行时，用户应通过 OMP_NUM_THREADS 或 set_num_threads 限制线程数。
+  // CPU 亲和性仍由 OpenMP 运行时解析（GOMP_CPU_AFFINITY / KMP_AFFINITY）。
+  omp_set_dynamic(0);
+  if (std::getenv("OMP_NUM_THREADS") == nullptr) {
+    omp_set_num_threads(omp_get_num_procs());
+  }
+
   m.def(
       "set_num_threads", [](int n) { omp_set_num_threads(n); },
       "Set global OpenMP thread count", py::arg("num_threads"));
+  m.def(
+      "get_max_threads", []() { return omp_get_max_threads(); },
+      "Get the current OpenMP thread budget");
 #else
   m.def(
       "set_num_threads",
       [](int) { py::print("OpenMP not available; call ignored"); },
       "Dummy set_num_threads when OpenMP is disabled", py::arg("num_threads"));
+  m.def(
+      "get_max_threads", []() { return 1; },
+      "Dummy get_max_threads when OpenMP is disabled");
 #endif
 
   py::class_<Graph>(m, "Graph")
@@ -1,18 +1,34 @@
+import functools
+import hashlib
+import json
 import os
+import pathlib
 import platform
+import shutil
+import subprocess
+import sys
 from distutils.errors import CompileError, LinkError
 
 import numpy as np
 import pybind11
-from setuptools import Extension, setup
-from setuptools.command.build_ext import build_ext
+from pybind11.setup_helpers import ParallelCompile, Pybind11Extension
+from pybind11.setup_helpers import build_ext
+from setuptools import setup
+from setuptools.command.sdist import sdist
+
+# 并行编译所有 C++ 源文件（线程数可用 DEEPSEARCH_NUM_BUILD_JOBS 覆盖）
+ParallelCompile("DEEPSEARCH_NUM_BUILD_JOBS", default=0).install()
 
 # 项目信息
 __version__ = '0.1.0'
 MODULE_NAME = 'deepsearch'
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 源码仓库中 setup.py 位于 python_bindings/ 子目录，src/ 在上一层；
+# 解包后的 sdist 中 setup.py 位于 tarball 根目录，src/ 与其同级
+BINDINGS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = (BINDINGS_DIR
+                if os.path.isdir(os.path.join(BINDINGS_DIR, "src"))
+                else os.path.dirname(BINDINGS_DIR))
 SRC_DIR = os.path.join(PROJECT_ROOT, "src")
-BINDINGS_DIR = os.path.join(PROJECT_ROOT, "python_bindings")
 
 # 平台信息
 IS_WINDOWS = platform.system() == "Windows"
@@ -20,19 +36,65 @@ IS_MACOS = platform.system() == "Darwin"
 IS_LINUX = platform.system() == "Linux"
 
 
+@functools.lru_cache(maxsize=None)
 def find_cpp_sources(directory):
-    return [
-        os.path.join(root, file)
-        for root, _, files in os.walk(directory)
-        for file in files if file.endswith(".cpp")
-    ]
+    # 排序保证构建输入顺序可复现（提升 ccache 命中率）
+    return sorted(str(p) for p in pathlib.Path(directory).rglob("*.cpp"))
+
+
+# main.cpp 定义可执行入口；hnsw_builder.cpp 被 builder_factory.cpp
+# 文本 #include（模板实现），单独编译会重复定义其中的符号——
+# 两者都不能作为扩展的独立 TU
+EXCLUDED_SOURCES = {'main.cpp', 'hnsw_builder.cpp'}
+
+
+def find_extension_sources():
+    return [p for p in find_cpp_sources(SRC_DIR)
+            if os.path.basename(p) not in EXCLUDED_SOURCES]
+
+
+SOURCE_MANIFEST = os.path.join(BINDINGS_DIR, "sources.txt")
+
+
+def load_source_manifest():
+    """读取 sdist 附带的源文件清单；不存在时返回 None，回退到目录扫描
+
+    从源码 tarball 安装时无需遍历 src/ 树，同时保证各 CI 构建的输入
+    完全一致。清单由 Sdist.make_release_tree 生成。
+    """
+    try:
+        with open(SOURCE_MANIFEST) as f:
+            paths = f.read().split()
+    except OSError:
+        return None
+    return [os.path.join(PROJECT_ROOT, p) for p in paths] or None
+
 
+def read_readme():
+    """仅在打包命令需要 long_description 时读取 README
 
-def get_openmp_flags():
+    build_ext/develop/egg_info 等命令用不到 long_description，
+    没必要在每次 setup.py 执行时都读盘。按绝对路径读取，不依赖 cwd。
+    """
+    if not {'sdist', 'bdist_wheel', 'upload'} & set(sys.argv):
+        return ''
+    try:
+        return (pathlib.Path(PROJECT_ROOT) / 'README.md').read_text(encoding='utf-8')
+    except OSError:
+        return ''
+
+
+def get_openmp_flags(library_dir=None):
     if IS_WINDOWS:
         return ["/openmp"], []
     elif IS_MACOS:
-        return ["-Xpreprocessor", "-fopenmp"], ["-lomp"]
+        # -Xclang -fopenmp 保留完整的 OpenMP 代码生成（含 omp simd 向量化），
+        # -Xpreprocessor 只过预处理器，会丢失这些优化；
+        # rpath 让运行时无需 DYLD_LIBRARY_PATH 即可找到 Homebrew 的 libomp
+        link_flags = ["-lomp"]
+        if library_dir:
+            link_flags.append(f"-Wl,-rpath,{library_dir}")
+        return ["-Xclang", "-fopenmp"], link_flags
     elif IS_LINUX:
         return ["-fopenmp"], ["-fopenmp"]
     return [], []
@@ -54,29 +116,76 @@ class BuildExt(build_ext):
                 self.openmp_include_dir = '/opt/homebrew/opt/libomp/include'
             if not self.openmp_library_dir:
                 self.openmp_library_dir = '/opt/homebrew/opt/libomp/lib'
+        self._openmp_supported = None
+
+    @property
+    def openmp_supported(self):
+        """OpenMP 探测结果，每次 build_ext 命令最多执行一次"""
+        if self._openmp_supported is None:
+            os.makedirs(self.build_temp, exist_ok=True)
+            self._openmp_supported = self._check_openmp()
+        return self._openmp_supported
 
     def build_extensions(self):
-        cpp_flag = '/std:c++17' if IS_WINDOWS else '-std=c++17'
+        self._setup_compiler_cache()
+        self._setup_per_source_flags()
+
+        # 发布版优化选项（距离计算内核依赖自动向量化）
+        # C++ 标准、符号可见性和 MSVC 的 /EHsc、/bigobj 由 Pybind11Extension 提供
+        if IS_WINDOWS:
+            opt_flags = ['/O2', '/fp:fast', '/arch:AVX2']
+            opt_link_flags = []
+        else:
+            opt_flags = ['-O3', '-ffast-math', '-funroll-loops', '-fno-math-errno']
+            opt_link_flags = []
+            # -march=native 生成不可移植的 wheel，需显式开启
+            if os.environ.get('DEEPSEARCH_NATIVE') == '1':
+                opt_flags.append('-march=native')
+            if os.environ.get('DEEPSEARCH_LTO') == '1':
+                opt_flags.append('-flto=auto')
+                opt_link_flags.append('-flto=auto')
+            if not self.debug:
+                # 按函数/数据分节 + 链接期回收死代码并去符号，
+                # 缩小 .so 以加快 import 时的 dlopen 和缺页加载
+                opt_flags += ['-ffunction-sections', '-fdata-sections',
+                              '-fvisibility-inlines-hidden']
+                if IS_MACOS:
+                    opt_link_flags.append('-Wl,-dead_strip')
+                else:
+                    opt_link_flags += ['-Wl,--gc-sections', '-Wl,-s']
+
+        multiarch = self._check_multiarch()
+
+        if os.environ.get('DEEPSEARCH_UNITY'):
+            for ext in self.extensions:
+                self._apply_unity_build(ext)
+
+        fixed_dim_file = self._generate_fixed_dim_sources(
+            os.environ.get('DEEPSEARCH_DIMS', '128,256,384,768'))
 
         for ext in self.extensions:
-            ext.extra_compile_args = [cpp_flag]
-            ext.include_dirs.extend([
-                pybind11.get_include(),
-                np.get_include(),
-                SRC_DIR
-            ])
-            if not IS_WINDOWS:
-                ext.extra_compile_args += [
-                    f'-DVERSION_INFO="{self.distribution.get_version()}"',
-                    '-fvisibility=hidden'
-                ]
-            else:
-                ext.extra_compile_args += [f'/DVERSION_INFO=\\"{self.distribution.get_version()}\\"']
-
-            if not self.disable_openmp and self._check_openmp():
-                compile_flags, link_flags = get_openmp_flags()
+            ext.extra_compile_args += opt_flags
+            ext.extra_link_args += opt_link_flags
+            if multiarch:
+                ext.define_macros.append(('DEEPSEARCH_MULTIARCH', '1'))
+            # 批量小于该值时不开并行区，避免 OpenMP 启动开销得不偿失
+            ext.define_macros.append(
+                ('DEEPSEARCH_OMP_CUTOFF', os.environ.get('DEEPSEARCH_OMP_CUTOFF', '1')))
+            if fixed_dim_file:
+                ext.sources.append(fixed_dim_file)
+                ext.define_macros.append(('DEEPSEARCH_FIXED_DIMS', '1'))
+            ext.include_dirs.append(np.get_include())
+            # define_macros 让 distutils 按平台生成规范的 -D//D 形式，
+            # 无需手写转义引号，参数串稳定也有利于 ccache 命中
+            ext.define_macros.append(
+                ('VERSION_INFO', '"%s"' % self.distribution.get_version()))
+
+            if not self.disable_openmp and self.openmp_supported:
+                compile_flags, link_flags = get_openmp_flags(self.openmp_library_dir)
                 ext.extra_compile_args += compile_flags
                 ext.extra_link_args += link_flags
+                # 通知 bindings.cpp 编译线程控制接口
+                ext.define_macros.append(('DEEPSEARCH_HAVE_OPENMP', '1'))
 
                 # 包含和库路径设置
                 if self.openmp_include_dir:
@@ -89,9 +198,309 @@ class BuildExt(build_ext):
                 elif IS_MACOS:
                     ext.library_dirs.append('/opt/homebrew/opt/libomp/lib')
 
+            self._use_bindings_object_cache(ext)
+
         super().build_extensions()
+        self._store_bindings_object()
+
+    def _apply_unity_build(self, ext):
+        """DEEPSEARCH_UNITY=1 时把 src 下的所有 TU 合并为一个生成的 unity.cpp
+
+        标准库头文件的解析和模板实例化只需付一次，编译器调用从 N 次降到
+        1 次，优化器也能跨原 TU 内联。bindings.cpp 保持独立编译，
+        内核中的头文件模板仍可复用。与 ccache 正交，可叠加。
+        """
+        unity_sources = [s for s in ext.sources
+                         if os.path.basename(s) != 'bindings.cpp']
+        if not unity_sources:
+            return
+        kept_sources = [s for s in ext.sources if s not in unity_sources]
+
+        content = ''.join(f'#include "{os.path.abspath(s)}"\n'
+                          for s in unity_sources)
+        os.makedirs(self.build_temp, exist_ok=True)
+        unity_file = os.path.join(self.build_temp, 'unity.cpp')
+        # 内容未变时不重写，保持 mtime 稳定以便增量构建/ccache 命中
+        try:
+            with open(unity_file) as f:
+                up_to_date = f.read() == content
+        except OSError:
+            up_to_date = False
+        if not up_to_date:
+            with open(unity_file, 'w') as f:
+                f.write(content)
+
+        ext.sources = kept_sources + [unity_file]
+
+    def _use_bindings_object_cache(self, ext):
+        """按语义输入哈希复用 bindings.cpp 的目标文件
+
+        pybind11 的模板展开让 bindings.cpp 的编译在增量构建中占大头。
+        缓存键由传递包含闭包的内容、pybind11 版本和完整编译参数构成，
+        不依赖 mtime，因此与 ccache 叠加且在 ccache 目录被清理后依然
+        有效。命中时直接注入 extra_objects 并跳过编译，未命中则在构建
+        结束后由 _store_bindings_object 回填缓存（见 ~/.cache/deepsearch/objs）。
+        """
+        self._bindings_cache_entry = None
+        if self.compiler.compiler_type != 'unix':
+            return
+        bindings = next((s for s in ext.sources
+                         if os.path.basename(s) == 'bindings.cpp'), None)
+        if bindings is None:
+            return
+        dep_digest = self._bindings_dep_digest(ext, bindings)
+        if dep_digest is None:
+            return
+
+        key = hashlib.sha256(repr((
+            dep_digest,
+            pybind11.__version__,
+            self.compiler.compiler_so,
+            ext.extra_compile_args,
+            ext.define_macros,
+            ext.include_dirs,
+        )).encode()).hexdigest()
+        cached_obj = os.path.join(os.path.expanduser('~'), '.cache',
+                                  'deepsearch', 'objs', f'{key}.o')
+
+        if os.path.exists(cached_obj):
+            ext.sources.remove(bindings)
+            ext.extra_objects.append(cached_obj)
+            print(f"Reusing cached bindings object: {cached_obj}")
+        else:
+            self._bindings_cache_entry = (bindings, cached_obj)
+
+    def _bindings_dep_digest(self, ext, bindings):
+        """对 bindings.cpp 的传递包含闭包（编译器 -MM 输出）内容求哈希
+
+        只哈希源文件本身会漏掉被绑定类型头文件的改动，复用旧目标文件
+        会造成 ABI 不匹配；-MM 把 searcher.h、hnsw/*.h 等全部实际包含
+        的非系统头文件列出来。闭包求取失败时返回 None，放弃缓存。
+        """
+        cmd = list(self.compiler.compiler_so)
+        cmd += [f'-I{d}' for d in list(ext.include_dirs) + list(self.include_dirs or [])]
+        for name, value in ext.define_macros:
+            cmd.append(f'-D{name}={value}' if value is not None else f'-D{name}')
+        cmd += list(ext.extra_compile_args) + ['-MM', bindings]
+        try:
+            out = subprocess.run(cmd, capture_output=True, text=True,
+                                 check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        deps = [d for d in out.replace('\\\n', ' ').split()
+                if not d.endswith(':')]
+        digest = hashlib.sha256()
+        try:
+            for dep in sorted(set(deps)):
+                with open(dep, 'rb') as f:
+                    digest.update(f.read())
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _store_bindings_object(self):
+        """冷编译后把 bindings.cpp 的目标文件回填到缓存目录"""
+        if not getattr(self, '_bindings_cache_entry', None):
+            return
+        bindings, cached_obj = self._bindings_cache_entry
+        try:
+            objs = self.compiler.object_filenames(
+                [bindings], strip_dir=0, output_dir=self.build_temp)
+            if objs and os.path.exists(objs[0]):
+                os.makedirs(os.path.dirname(cached_obj), exist_ok=True)
+                shutil.copy2(objs[0], cached_obj)
+        except Exception as e:
+            print(f"Failed to cache bindings object: {e}")
+
+    def _setup_per_source_flags(self):
+        """非绑定 TU 追加 -fno-rtti，与 CMake 构建的 COMMON_FLAGS 保持一致
+
+        RTTI 元数据增大 .text 并抑制部分去虚化优化；内核代码不使用
+        dynamic_cast/typeid，而 pybind11 的错误转换依赖 RTTI，因此仅
+        bindings.cpp 保留。内核会抛异常，不能使用 -fno-exceptions。
+        """
+        if self.compiler.compiler_type != 'unix':
+            return
+        if not self._check_flag('no_rtti', 'int main() { return 0; }\n',
+                                ['-fno-rtti']):
+            return
+
+        original_compile = self.compiler._compile
+
+        def compile_with_per_source_flags(obj, src, ext, cc_args,
+                                          extra_postargs, pp_opts):
+            if os.path.basename(src) != 'bindings.cpp':
+                extra_postargs = extra_postargs + ['-fno-rtti']
+            return original_compile(obj, src, ext, cc_args,
+                                    extra_postargs, pp_opts)
+
+        self.compiler._compile = compile_with_per_source_flags
+
+    def _generate_fixed_dim_sources(self, dims):
+        """按 DEEPSEARCH_DIMS 生成固定维度距离内核的显式实例化 TU
+
+        ANN 索引的维度在建库后固定（常见 128/256/384/768），编译期已知
+        的循环次数让 -O3 完全展开并向量化距离内核。生成的查表函数由
+        src/simd/distance_fixed.h 声明；DEEPSEARCH_DIMS= 置空可关闭。
+        """
+        try:
+            values = sorted({int(d) for d in dims.split(',') if d.strip()})
+        except ValueError:
+            print(f"Invalid DEEPSEARCH_DIMS value: {dims!r}; skipping codegen")
+            return None
+        if not values:
+            return None
+
+        lines = [
+            '// Generated by setup.py from DEEPSEARCH_DIMS; do not edit.',
+            '#include "simd/distance_fixed.h"',
+            '',
+            'namespace deepsearch {',
+            'namespace simd {',
+            '',
+            'FixedDistFunc getFixedL2Sqr(size_t dim) {',
+            '  switch (dim) {',
+        ]
+        lines += [f'    case {d}: return L2SqrFixed<{d}>;' for d in values]
+        lines += [
+            '    default: return nullptr;',
+            '  }',
+            '}',
+            '',
+            'FixedDistFunc getFixedIP(size_t dim) {',
+            '  switch (dim) {',
+        ]
+        lines += [f'    case {d}: return IPFixed<{d}>;' for d in values]
+        lines += [
+            '    default: return nullptr;',
+            '  }',
+            '}',
+            '',
+            '}  // namespace simd',
+            '}  // namespace deepsearch',
+            '',
+        ]
+        content = '\n'.join(lines)
+
+        os.makedirs(self.build_temp, exist_ok=True)
+        gen_file = os.path.join(self.build_temp, 'fixed_dim_instantiations.cpp')
+        # 内容未变时不重写，保持 mtime 稳定以便增量构建/ccache 命中
+        try:
+            with open(gen_file) as f:
+                up_to_date = f.read() == content
+        except OSError:
+            up_to_date = False
+        if not up_to_date:
+            with open(gen_file, 'w') as f:
+                f.write(content)
+        return gen_file
+
+    def _setup_compiler_cache(self):
+        """优先使用 ccache/sccache 包装编译器，加速无改动的重复构建
+
+        缓存目录可通过 CCACHE_DIR 环境变量配置，
+        设置 DEEPSEARCH_NO_CCACHE=1 可禁用此功能。
+        """
+        if os.environ.get('DEEPSEARCH_NO_CCACHE'):
+            return
+
+        if self.compiler.compiler_type == 'msvc':
+            sccache = shutil.which('sccache')
+            if sccache:
+                os.environ['CC'] = 'sccache cl'
+            return
+
+        launcher = shutil.which('ccache') or shutil.which('sccache')
+        if not launcher:
+            return
+
+        # 按内容哈希识别编译器，避免跨编译器误命中
+        os.environ.setdefault('CCACHE_COMPILERCHECK', 'content')
+        for attr in ('compiler', 'compiler_so', 'compiler_cxx'):
+            cmd = getattr(self.compiler, attr, None)
+            if cmd and cmd[0] != launcher:
+                setattr(self.compiler, attr, [launcher] + cmd)
+
+    def _check_multiarch(self):
+        """检测编译器是否支持按函数粒度的 __attribute__((target)) 多指令集编译
+
+        支持时定义 DEEPSEARCH_MULTIARCH，单个可移植二进制同时携带
+        AVX2/AVX-512 距离内核，由 SIMDCapabilities 在运行时选择。
+        """
+        if IS_WINDOWS or platform.machine().lower() not in (
+                'x86_64', 'amd64', 'i386', 'i686'):
+            return False
+        test_code = """
+        #include <immintrin.h>
+        __attribute__((target("avx2,fma")))
+        float sum8(const float* p) {
+            __m256 v = _mm256_loadu_ps(p);
+            return _mm256_cvtss_f32(_mm256_add_ps(v, v));
+        }
+        __attribute__((target("avx512f,avx512dq")))
+        float sum16(const float* p) {
+            __m512 v = _mm512_loadu_ps(p);
+            return _mm512_reduce_add_ps(v);
+        }
+        int main() { return 0; }
+        """
+        return self._check_flag("multiarch", test_code)
+
+    def _check_flag(self, name, test_code, compile_args=None, link_args=None):
+        """尝试编译测试程序以检测编译器对某特性/选项的支持"""
+        try:
+            tmp_dir = self.build_temp
+            os.makedirs(tmp_dir, exist_ok=True)
+            test_file = os.path.join(tmp_dir, f"test_{name}.cpp")
+            with open(test_file, "w") as f:
+                f.write(test_code)
+
+            objs = self.compiler.compile([test_file], output_dir=tmp_dir,
+                                         extra_postargs=compile_args or [])
+            self.compiler.link_executable(objs, os.path.join(tmp_dir, f"test_{name}_exec"),
+                                          extra_postargs=link_args or [])
+            return True
+        except (CompileError, LinkError, Exception):
+            return False
 
     def _check_openmp(self):
+        """检测 OpenMP 支持，探测结果按（编译器、平台、路径）缓存
+
+        探测需要编译并链接一个测试程序，开销数百毫秒；结果只取决于
+        编译器和 OPENMP_* 环境，缓存在 build_temp/openmp_probe.json 中，
+        命中时直接返回。
+        """
+        compiler_cmd = getattr(self.compiler, 'compiler', [self.compiler.compiler_type])
+        key = hashlib.sha256(repr((
+            compiler_cmd[0],
+            platform.platform(),
+            self.openmp_include_dir,
+            self.openmp_library_dir,
+        )).encode()).hexdigest()
+
+        cache_file = os.path.join(self.build_temp, 'openmp_probe.json')
+        cache = {}
+        try:
+            with open(cache_file) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if key in cache:
+            return cache[key]
+
+        result = self._probe_openmp()
+
+        cache[key] = result
+        os.makedirs(self.build_temp, exist_ok=True)
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+        return result
+
+    def _probe_openmp(self):
         """尝试编译测试程序以检测 OpenMP 支持"""
         test_code = """
         #include <omp.h>
@@ -105,12 +514,11 @@ class BuildExt(build_ext):
         """
         try:
             tmp_dir = self.build_temp
-            os.makedirs(tmp_dir, exist_ok=True)
             test_file = os.path.join(tmp_dir, "test_openmp.cpp")
             with open(test_file, "w") as f:
                 f.write(test_code)
 
-            compile_args, link_args = get_openmp_flags()
+            compile_args, link_args = get_openmp_flags(self.openmp_library_dir)
             if self.openmp_include_dir:
                 compile_args += ["-I", self.openmp_include_dir]
             if self.openmp_library_dir:
@@ -124,15 +532,42 @@ class BuildExt(build_ext):
             return False
 
 
-# 构建 Extension 模块
-source_files = [os.path.join(BINDINGS_DIR, "bindings.cpp")] + find_cpp_sources(SRC_DIR)
+class Sdist(sdist):
+    def make_release_tree(self, base_dir, files):
+        super().make_release_tree(base_dir, files)
+        # 把当前的源文件清单写入发布树，安装 tarball 时跳过目录扫描；
+        # 清单只列参与编译的 TU
+        rel_paths = sorted(os.path.relpath(p, PROJECT_ROOT)
+                           for p in find_extension_sources())
+        with open(os.path.join(base_dir, "sources.txt"), "w") as f:
+            f.write("\n".join(rel_paths) + "\n")
+
+        # sdist 根目录即 setup.py 所在目录，MANIFEST.in 无法引用上层的
+        # src/，手动把源码、头文件和 README 复制进发布树。
+        # hnsw_builder.cpp 不单独编译，但被 builder_factory.cpp 文本
+        # #include，仍需随包分发；main.cpp 与扩展无关，跳过
+        extra = [p for p in find_cpp_sources(SRC_DIR)
+                 if os.path.basename(p) != 'main.cpp']
+        extra += [str(p) for p in pathlib.Path(SRC_DIR).rglob('*.h')]
+        readme = os.path.join(PROJECT_ROOT, 'README.md')
+        if os.path.exists(readme):
+            extra.append(readme)
+        for path in extra:
+            dest = os.path.join(base_dir, os.path.relpath(path, PROJECT_ROOT))
+            self.mkpath(os.path.dirname(dest))
+            self.copy_file(path, dest)
+
+
+# 构建 Extension 模块（优先使用 sdist 附带的清单）
+source_files = [os.path.join(BINDINGS_DIR, "bindings.cpp")] + (
+    load_source_manifest() or find_extension_sources())
 
 ext_modules = [
-    Extension(
+    Pybind11Extension(
         MODULE_NAME,
         sources=source_files,
-        include_dirs=[],  # 会在 build_ext 中添加
-        language="c++"
+        include_dirs=[SRC_DIR],  # numpy 头文件在 build_ext 中添加
+        cxx_std=17,
     )
 ]
 
@@ -141,13 +576,13 @@ setup(
     name=MODULE_NAME,
     version=__version__,
     description='Deep Approximate Nearest Neighbor Search',
-    long_description=open('README.md').read() if os.path.exists('README.md') else '',
+    long_description=read_readme(),
     long_description_content_type='text/markdown',
     author='Koschei',
     author_email='nitianzero@gmail.com',
     url='https://github.com/kosthi/deepsearch',
     ext_modules=ext_modules,
-    cmdclass={'build_ext': BuildExt},
+    cmdclass={'build_ext': BuildExt, 'sdist': Sdist},
     install_requires=[
         'numpy>=1.18',
         'pybind11>=2.6'
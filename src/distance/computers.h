@@ -5,6 +5,7 @@
 
 #include "core/interfaces.h"
 #include "searcher/searcher.h"
+#include "simd/distance_fixed.h"
 #include "simd/distance_functions.h"
 
 namespace deepsearch {
@@ -16,12 +17,14 @@ using quantization::QuantizerType;
 template <typename T, QuantizerType Quantizer = QuantizerType::FP32>
 class L2DistanceComputer : public core::DistanceComputerTemplate<T> {
  public:
-  explicit L2DistanceComputer(size_t dim) : dim_(dim) {}
+  explicit L2DistanceComputer(size_t dim)
+      : dim_(dim), fixed_(simd::getFixedL2Sqr(dim)) {}
 
   float compute(const T* a, const T* b) const override {
     // 首先根据数据类型T进行分支
     if constexpr (std::is_same_v<T, float>) {
-      // float类型数据，使用标准L2 SIMD函数
+      // 优先使用固定维度的完全展开内核，否则用标准L2 SIMD函数
+      if (fixed_) return fixed_(a, b);
       return simd::L2Sqr(a, b, dim_);
     } else if constexpr (std::is_same_v<T, uint8_t>) {
       // uint8_t类型数据，根据量化类型选择优化函数
@@ -50,6 +53,7 @@ class L2DistanceComputer : public core::DistanceComputerTemplate<T> {
 
  private:
   size_t dim_;
+  simd::FixedDistFunc fixed_;
 
   float computeGeneric(const T* a, const T* b) const {
     float result = 0;
@@ -65,12 +69,14 @@ class L2DistanceComputer : public core::DistanceComputerTemplate<T> {
 template <typename T, QuantizerType Quantizer = QuantizerType::FP32>
 class IPDistanceComputer : public core::DistanceComputerTemplate<T> {
  public:
-  explicit IPDistanceComputer(size_t dim) : dim_(dim) {}
+  explicit IPDistanceComputer(size_t dim)
+      : dim_(dim), fixed_(simd::getFixedIP(dim)) {}
 
   float compute(const T* a, const T* b) const override {
     // 首先根据数据类型T进行分支
     if constexpr (std::is_same_v<T, float>) {
-      // float类型数据，使用标准L2 SIMD函数
+      // 优先使用固定维度的完全展开内核，否则用标准IP SIMD函数
+      if (fixed_) return 1.0f - fixed_(a, b);
       return 1.0f - simd::IP(a, b, dim_);
     } else if constexpr (std::is_same_v<T, uint8_t>) {
       // uint8_t类型数据，根据量化类型选择优化函数
@@ -97,6 +103,7 @@ class IPDistanceComputer : public core::DistanceComputerTemplate<T> {
 
  private:
   size_t dim_;
+  simd::FixedDistFunc fixed_;
 
   float computeGeneric(const T* a, const T* b) const {
     float result = 0;
@@ -0,0 +1,44 @@
+#pragma once
+
+#include <cstddef>
+
+namespace deepsearch {
+namespace simd {
+
+/**
+ * 固定维度的距离内核
+ *
+ * 循环次数在编译期已知，-O3 下编译器可完全展开并向量化为直线式
+ * SIMD 序列。实例化集合由 setup.py 按 DEEPSEARCH_DIMS 环境变量在
+ * 构建时生成；未生成时查找函数返回 nullptr，调用方回退到通用内核。
+ */
+
+using FixedDistFunc = float (*)(const float*, const float*);
+
+template <size_t Dim>
+float L2SqrFixed(const float* pVect1, const float* pVect2) {
+  float res = 0;
+  for (size_t i = 0; i < Dim; i++) {
+    float t = pVect1[i] - pVect2[i];
+    res += t * t;
+  }
+  return res;
+}
+
+template <size_t Dim>
+float IPFixed(const float* pVect1, const float* pVect2) {
+  float res = 0;
+  for (size_t i = 0; i < Dim; i++) {
+    res += pVect1[i] * pVect2[i];
+  }
+  return res;
+}
+
+/**
+ * 按维度查表；对应维度未实例化时返回 nullptr
+ */
+FixedDistFunc getFixedL2Sqr(size_t dim);
+FixedDistFunc getFixedIP(size_t dim);
+
+}  // namespace simd
+}  // namespace deepsearch
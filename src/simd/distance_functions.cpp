@@ -2,9 +2,18 @@
 
 #include <cmath>
 
+#include "distance_fixed.h"
+
 namespace deepsearch {
 namespace simd {
 
+// setup.py 生成固定维度实例化 TU 时定义 DEEPSEARCH_FIXED_DIMS，
+// 查表实现由生成的 TU 提供；否则退化为空表，调用方走通用内核
+#ifndef DEEPSEARCH_FIXED_DIMS
+FixedDistFunc getFixedL2Sqr(size_t) { return nullptr; }
+FixedDistFunc getFixedIP(size_t) { return nullptr; }
+#endif
+
 // Global function pointers definition
 L2SqrFunc L2Sqr = nullptr;
 IPFunc IP = nullptr;
@@ -212,7 +221,8 @@ float IP_sse(const float* pVect1, const float* pVect2, size_t qty) {
 }
 #endif
 
-#ifdef __AVX2__
+#ifdef DEEPSEARCH_USE_AVX2
+DEEPSEARCH_TARGET_AVX2
 float L2Sqr_avx2(const float* pVect1, const float* pVect2, size_t qty) {
   float res = 0;
   size_t qty8 = qty >> 3;
@@ -240,6 +250,7 @@ float L2Sqr_avx2(const float* pVect1, const float* pVect2, size_t qty) {
   return res;
 }
 
+DEEPSEARCH_TARGET_AVX2
 float IP_avx2(const float* pVect1, const float* pVect2, size_t qty) {
   float res = 0;
   size_t qty8 = qty >> 3;
@@ -265,11 +276,10 @@ float IP_avx2(const float* pVect1, const float* pVect2, size_t qty) {
   return res;
 }
 
-float L2SqrSQ4_avx2(const void* pVect1v, const void* pVect2v,
-                    const void* qty_ptr) {
+DEEPSEARCH_TARGET_AVX2
+float L2SqrSQ4_avx2(const void* pVect1v, const void* pVect2v, size_t qty) {
   const uint8_t* pVect1 = static_cast<const uint8_t*>(pVect1v);
   const uint8_t* pVect2 = static_cast<const uint8_t*>(pVect2v);
-  size_t qty = *static_cast<const size_t*>(qty_ptr);
 
   float res = 0;
   size_t qty_bytes = (qty + 1) / 2;
@@ -291,17 +301,17 @@ float L2SqrSQ4_avx2(const void* pVect1v, const void* pVect2v,
     __m128i v2_low = _mm_and_si128(v2_packed, mask);
     __m128i v2_high = _mm_and_si128(_mm_srli_epi16(v2_packed, 4), mask);
 
-    // Convert to float and compute differences
-    __m256i v1_16_low = _mm256_cvtepu8_epi16(v1_low);
-    __m256i v2_16_low = _mm256_cvtepu8_epi16(v2_low);
-
-    __m256 v1_f_low = _mm256_cvtepi32_ps(
-        _mm256_cvtepi16_epi32(_mm256_castsi256_si128(v1_16_low)));
-    __m256 v2_f_low = _mm256_cvtepi32_ps(
-        _mm256_cvtepi16_epi32(_mm256_castsi256_si128(v2_16_low)));
-
-    __m256 diff_low = _mm256_sub_ps(v1_f_low, v2_f_low);
-    sum = _mm256_fmadd_ps(diff_low, diff_low, sum);
+    // 每个寄存器 16 个 4-bit 值，按 8 字节一组转为 float 并累加差值平方
+    __m128i v1_parts[4] = {v1_low, _mm_srli_si128(v1_low, 8), v1_high,
+                           _mm_srli_si128(v1_high, 8)};
+    __m128i v2_parts[4] = {v2_low, _mm_srli_si128(v2_low, 8), v2_high,
+                           _mm_srli_si128(v2_high, 8)};
+    for (int part = 0; part < 4; part++) {
+      __m256 v1_f = _mm256_cvtepi32_ps(_mm256_cvtepu8_epi32(v1_parts[part]));
+      __m256 v2_f = _mm256_cvtepi32_ps(_mm256_cvtepu8_epi32(v2_parts[part]));
+      __m256 diff = _mm256_sub_ps(v1_f, v2_f);
+      sum = _mm256_fmadd_ps(diff, diff, sum);
+    }
 
     pVect1 += 16;
     pVect2 += 16;
@@ -342,7 +352,8 @@ float L2SqrSQ4_avx2(const void* pVect1v, const void* pVect2v, size_t qty) {
 }
 #endif
 
-#ifdef __AVX512F__
+#ifdef DEEPSEARCH_USE_AVX512
+DEEPSEARCH_TARGET_AVX512
 float L2Sqr_avx512(const float* pVect1, const float* pVect2, size_t qty) {
   float res = 0;
   size_t qty16 = qty >> 4;
@@ -370,6 +381,7 @@ float L2Sqr_avx512(const float* pVect1, const float* pVect2, size_t qty) {
   return res;
 }
 
+DEEPSEARCH_TARGET_AVX512
 float IP_avx512(const float* pVect1, const float* pVect2, size_t qty) {
   float res = 0;
   size_t qty16 = qty >> 4;
@@ -395,11 +407,10 @@ float IP_avx512(const float* pVect1, const float* pVect2, size_t qty) {
   return res;
 }
 
-float L2SqrSQ8_avx512(const void* pVect1v, const void* pVect2v,
-                      const void* qty_ptr) {
+DEEPSEARCH_TARGET_AVX512
+float L2SqrSQ8_avx512(const void* pVect1v, const void* pVect2v, size_t qty) {
   const uint8_t* pVect1 = static_cast<const uint8_t*>(pVect1v);
   const uint8_t* pVect2 = static_cast<const uint8_t*>(pVect2v);
-  size_t qty = *static_cast<const size_t*>(qty_ptr);
 
   float res = 0;
   size_t qty16 = qty >> 4;
@@ -435,11 +446,10 @@ float L2SqrSQ8_avx512(const void* pVect1v, const void* pVect2v,
   return res;
 }
 
-float IPSQ8_avx512(const void* pVect1v, const void* pVect2v,
-                   const void* qty_ptr) {
+DEEPSEARCH_TARGET_AVX512
+float IPSQ8_avx512(const void* pVect1v, const void* pVect2v, size_t qty) {
   const uint8_t* pVect1 = static_cast<const uint8_t*>(pVect1v);
   const uint8_t* pVect2 = static_cast<const uint8_t*>(pVect2v);
-  size_t qty = *static_cast<const size_t*>(qty_ptr);
 
   float res = 0;
   size_t qty16 = qty >> 4;
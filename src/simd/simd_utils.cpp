@@ -5,7 +5,7 @@ namespace simd {
 
 // SIMD Capability Detection Implementation
 bool SIMDCapabilities::hasAVX512() {
-#ifdef __AVX512F__
+#ifdef DEEPSEARCH_USE_AVX512
 #if defined(_WIN32)
   int cpuInfo[4];
   __cpuid(cpuInfo, 7);
@@ -23,7 +23,7 @@ bool SIMDCapabilities::hasAVX512() {
 }
 
 bool SIMDCapabilities::hasAVX2() {
-#ifdef __AVX2__
+#ifdef DEEPSEARCH_USE_AVX2
 #if defined(_WIN32)
   int cpuInfo[4];
   __cpuid(cpuInfo, 7);
@@ -86,8 +86,8 @@ SIMDCapabilities::Level SIMDCapabilities::getOptimalSIMD() {
 // }
 
 // SIMD Reduce Functions Implementation
-#ifdef __AVX512F__
-float reduce_add_f32x16(__m512 x) {
+#ifdef DEEPSEARCH_USE_AVX512
+DEEPSEARCH_TARGET_AVX512 float reduce_add_f32x16(__m512 x) {
   __m256 low = _mm512_castps512_ps256(x);
   __m256 high = _mm512_extractf32x8_ps(x, 1);
   __m256 sum256 = _mm256_add_ps(low, high);
@@ -95,8 +95,8 @@ float reduce_add_f32x16(__m512 x) {
 }
 #endif
 
-#ifdef __AVX2__
-float reduce_add_f32x8(__m256 x) {
+#ifdef DEEPSEARCH_USE_AVX2
+DEEPSEARCH_TARGET_AVX2 float reduce_add_f32x8(__m256 x) {
   __m128 low = _mm256_castps256_ps128(x);
   __m128 high = _mm256_extractf128_ps(x, 1);
   __m128 sum128 = _mm_add_ps(low, high);
@@ -105,7 +105,7 @@ float reduce_add_f32x8(__m256 x) {
 #endif
 
 #ifdef __SSE__
-float reduce_add_f32x4(__m128 x) {
+DEEPSEARCH_TARGET_SSE3 float reduce_add_f32x4(__m128 x) {
   __m128 shuf = _mm_movehdup_ps(x);
   __m128 sums = _mm_add_ps(x, shuf);
   shuf = _mm_movehl_ps(shuf, sums);
@@ -122,16 +122,16 @@ float reduce_add_f32x4(float32x4_t x) {
 #endif
 
 // Generic reduce function specializations
-#ifdef __AVX512F__
+#ifdef DEEPSEARCH_USE_AVX512
 template <>
-float reduce_add<__m512>(__m512 x) {
+DEEPSEARCH_TARGET_AVX512 float reduce_add<__m512>(__m512 x) {
   return reduce_add_f32x16(x);
 }
 #endif
 
-#ifdef __AVX2__
+#ifdef DEEPSEARCH_USE_AVX2
 template <>
-float reduce_add<__m256>(__m256 x) {
+DEEPSEARCH_TARGET_AVX2 float reduce_add<__m256>(__m256 x) {
   return reduce_add_f32x8(x);
 }
 #endif
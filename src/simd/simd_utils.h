@@ -17,6 +17,32 @@
 #endif
 #endif
 
+// ISA gates for the x86 kernels.
+// When DEEPSEARCH_MULTIARCH is defined (by the Python build after probing the
+// compiler), the AVX2 and AVX-512 kernel bodies are emitted from a baseline TU
+// via per-function __attribute__((target)) clones, so a single portable binary
+// still carries the wide-vector paths; runtime selection stays in
+// SIMDCapabilities. Without it the gates fall back to the compile-time
+// __AVX2__/__AVX512F__ macros as before.
+#if defined(DEEPSEARCH_MULTIARCH) && (defined(__GNUC__) || defined(__clang__)) && \
+    (defined(__x86_64__) || defined(__i386__))
+#define DEEPSEARCH_USE_AVX2 1
+#define DEEPSEARCH_USE_AVX512 1
+#define DEEPSEARCH_TARGET_SSE3 __attribute__((target("sse3")))
+#define DEEPSEARCH_TARGET_AVX2 __attribute__((target("avx2,fma")))
+#define DEEPSEARCH_TARGET_AVX512 __attribute__((target("avx512f,avx512dq")))
+#else
+#ifdef __AVX2__
+#define DEEPSEARCH_USE_AVX2 1
+#endif
+#ifdef __AVX512F__
+#define DEEPSEARCH_USE_AVX512 1
+#endif
+#define DEEPSEARCH_TARGET_SSE3
+#define DEEPSEARCH_TARGET_AVX2
+#define DEEPSEARCH_TARGET_AVX512
+#endif
+
 namespace deepsearch {
 namespace simd {
 
@@ -77,11 +103,11 @@ class SIMDCapabilities {
 /**
  * SIMD Reduce Functions
  */
-#ifdef __AVX512F__
+#ifdef DEEPSEARCH_USE_AVX512
 float reduce_add_f32x16(__m512 x);
 #endif
 
-#ifdef __AVX2__
+#ifdef DEEPSEARCH_USE_AVX2
 float reduce_add_f32x8(__m256 x);
 #endif
 